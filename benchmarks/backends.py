@@ -0,0 +1,71 @@
+"""Compares HTTP backends on the hot API endpoints
+
+Usage:
+    python benchmarks/backends.py https://useresponse.domain API_TOKEN \\
+        --user-id 42 --repeat 50
+"""
+import argparse
+import statistics
+import time
+
+from useresponse.api import (
+    API,
+    HttpxBackend,
+    RequestsBackend,
+    Urllib3Backend,
+)
+
+
+BACKENDS = (
+    ('requests', RequestsBackend, {}),
+    ('urllib3', Urllib3Backend, {}),
+    ('httpx', HttpxBackend, {'http2': False}),
+    ('httpx-http2', HttpxBackend, {'http2': True}),
+)
+
+
+def measure(call, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('domain')
+    parser.add_argument('api_token')
+    parser.add_argument('--user-id', type=int, required=True)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+
+    print(f'{"backend":<12} {"endpoint":<20} {"median ms":>10} {"p95 ms":>10}')
+    for name, backend_cls, kwargs in BACKENDS:
+        try:
+            backend = backend_cls(**kwargs)
+        except ImportError as e:
+            print(f'{name:<12} skipped: {e}')
+            continue
+        api = API(args.domain, args.api_token, backend=backend)
+        endpoints = (
+            ('/users/{id}.json', lambda: api.users.get(args.user_id)),
+            ('/tickets.json', lambda: api.tickets.search()),
+        )
+        try:
+            for endpoint, call in endpoints:
+                call()  # warm up connection pool
+                timings = sorted(measure(call, args.repeat))
+                median = statistics.median(timings) * 1000
+                p95 = timings[max(int(len(timings) * 0.95) - 1, 0)] * 1000
+                print(f'{name:<12} {endpoint:<20} '
+                      f'{median:>10.2f} {p95:>10.2f}')
+        finally:
+            backend.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -26,7 +26,12 @@ setup(
     packages=find_packages(),
     install_requires=[
         'requests',
+        'urllib3',
     ],
+    extras_require={
+        'httpx': ['httpx[http2]'],
+        'compression': ['brotli', 'zstandard'],
+    },
     python_requires='>=3.6',
     license='MIT',
     classifiers=[
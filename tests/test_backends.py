@@ -0,0 +1,116 @@
+import gzip
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlparse
+
+from useresponse.api import API, RequestsBackend, Urllib3Backend
+from useresponse.api.exceptions import APIConnectionError
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Responds with JSON description of the received request"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond()
+
+    def _respond(self):
+        url = urlparse(self.path)
+        if url.path == '/slow':
+            time.sleep(0.5)
+        length = int(self.headers.get('Content-Length') or 0)
+        echo = {
+            'method': self.command,
+            'path': url.path,
+            'query': parse_qs(url.query),
+            'content_type': self.headers.get('Content-Type'),
+            'body': self.rfile.read(length).decode('utf-8'),
+            'padding': 'x' * 2000,
+        }
+        body = json.dumps(echo).encode('utf-8')
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        if gzipped:
+            body = gzip.compress(body)
+        try:
+            self.send_response(200)
+            if gzipped:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class BackendTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = _Server(('127.0.0.1', 0), _EchoHandler)
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.backend = Urllib3Backend()
+
+    def tearDown(self):
+        self.backend.close()
+
+    def test_urllib3_encodes_params(self):
+        response = self.backend.request(
+            'GET', f'{self.url}/echo', params={'page': 2, 'text': 'a b'})
+        echo = response.json()
+        self.assertEqual(echo['query'], {'page': ['2'], 'text': ['a b']})
+
+    def test_urllib3_encodes_form_body(self):
+        response = self.backend.request(
+            'POST', f'{self.url}/echo', data={'email': 'a@b.c', 'id': 1})
+        echo = response.json()
+        self.assertEqual(
+            echo['content_type'], 'application/x-www-form-urlencoded')
+        self.assertEqual(parse_qs(echo['body']),
+                         {'email': ['a@b.c'], 'id': ['1']})
+
+    def test_urllib3_encodes_json_body(self):
+        response = self.backend.request(
+            'POST', f'{self.url}/echo', json={'title': 'T', 'id': 1})
+        echo = response.json()
+        self.assertEqual(echo['content_type'], 'application/json')
+        self.assertEqual(json.loads(echo['body']), {'title': 'T', 'id': 1})
+
+    def test_urllib3_timeout_is_unwrapped(self):
+        with self.assertRaises(self.backend.timeout_errors):
+            self.backend.request('GET', f'{self.url}/slow', timeout=(1, 0.1))
+
+    def test_connection_failure_is_api_connection_error(self):
+        for backend in (Urllib3Backend(), RequestsBackend()):
+            api = API('http://127.0.0.1:1', 'token', backend=backend)
+            with self.assertRaises(APIConnectionError):
+                api.users.get(1)
+            backend.close()
+
+    def test_transfer_size_of_gzip_response(self):
+        for backend in (Urllib3Backend(), RequestsBackend()):
+            response = backend.request('GET', f'{self.url}/echo')
+            wire_bytes, decoded_bytes = backend.transfer_size(response)
+            self.assertEqual(decoded_bytes, len(response.content))
+            self.assertGreater(wire_bytes, 0)
+            self.assertLess(wire_bytes, decoded_bytes)
+            backend.close()
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+
+from useresponse.api import API, Cassette, CassetteMode, HTTPBackend
+from useresponse.api.exceptions import CassetteMissError
+
+
+class FakeResponse(object):
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class CountingBackend(HTTPBackend):
+    """Answers every request with the number of requests made so far"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, method, url, params=None, data=None, json=None,
+                timeout=None):
+        self.calls += 1
+        return FakeResponse(200, {'success': self.calls})
+
+    def transfer_size(self, response):
+        return 0, 0
+
+
+class CassetteTestCase(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def record(self, calls):
+        backend = CountingBackend()
+        with Cassette(self.path, CassetteMode.record) as cassette:
+            api = API('http://useresponse.test', 's3kre7-token',
+                      cassette=cassette, backend=backend)
+            results = [call(api) for call in calls]
+        return results
+
+    def replay_api(self, **kwargs):
+        backend = CountingBackend()
+        cassette = Cassette(self.path, **kwargs)
+        api = API('http://useresponse.test', 'other-token',
+                  cassette=cassette, backend=backend)
+        return api, backend
+
+    def test_round_trip(self):
+        recorded = self.record([
+            lambda api: api.users.get(1),
+            lambda api: api.users.get_by_email('user@example.com'),
+        ])
+        api, backend = self.replay_api()
+        self.assertEqual(
+            [api.users.get(1), api.users.get_by_email('user@example.com')],
+            [{'success': 1}, 2],
+        )
+        self.assertEqual(recorded, [{'success': 1}, 2])
+        self.assertEqual(backend.calls, 0)
+
+    def test_secrets_are_not_written(self):
+        self.record([
+            lambda api: api.users.create(
+                'user@example.com', 'User', password='hunter2'),
+        ])
+        with open(self.path) as f:
+            content = f.read()
+        self.assertNotIn('s3kre7-token', content)
+        self.assertNotIn('hunter2', content)
+
+        api, _ = self.replay_api()
+        self.assertEqual(
+            api.users.create('user@example.com', 'User', password='other'), 1)
+
+    def test_identical_requests_replay_in_order(self):
+        self.record([lambda api: api.users.get(1)] * 2)
+        api, _ = self.replay_api()
+        self.assertEqual(
+            [api.users.get(1)['success'] for _ in range(3)], [1, 2, 2])
+
+    def test_unknown_request(self):
+        self.record([lambda api: api.users.get(1)])
+        api, _ = self.replay_api()
+        with self.assertRaises(CassetteMissError):
+            api.users.get(2)
+
+    def test_latency_validation(self):
+        with self.assertRaises(ValueError):
+            Cassette(self.path, CassetteMode.record, latency=-1)
+        with self.assertRaises(ValueError):
+            Cassette(self.path, CassetteMode.record, latency='slow')
+        with self.assertRaises(ValueError):
+            Cassette(self.path, CassetteMode.record, time_scale=-0.5)
+        cassette = Cassette(self.path, CassetteMode.record, latency='0.1')
+        self.assertEqual(cassette.latency, 0.1)
@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from useresponse.api import API, Cassette, CassetteMode, HTTPBackend
+from useresponse.api.deadline import Deadline
+from useresponse.api.exceptions import (
+    APITimeoutError,
+    DeadlineExceeded,
+    OperationCancelled,
+)
+
+
+class TimingOutBackend(HTTPBackend):
+    timeout_errors = (TimeoutError,)
+
+    def request(self, method, url, params=None, data=None, json=None,
+                timeout=None):
+        raise TimeoutError('connect timed out')
+
+
+class DeadlineTestCase(unittest.TestCase):
+    def test_sleep_is_interrupted_by_cancel(self):
+        deadline = Deadline(10)
+        threading.Timer(0.05, deadline.cancel).start()
+        started = time.monotonic()
+        with self.assertRaises(OperationCancelled):
+            deadline.sleep(5)
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_connect_timeout_cap_is_not_deadline_exceeded(self):
+        api = API('http://useresponse.test', 'token',
+                  backend=TimingOutBackend())
+        with self.assertRaises(APITimeoutError) as raised:
+            api.users.get(1, deadline=Deadline(10, connect_timeout=1))
+        self.assertIsInstance(raised.exception.__cause__, TimeoutError)
+
+    def test_timeout_without_deadline_is_api_timeout(self):
+        api = API('http://useresponse.test', 'token',
+                  backend=TimingOutBackend())
+        with self.assertRaises(APITimeoutError):
+            api.users.get(1)
+
+
+class CassetteReplayTestCase(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            key = json.dumps(['GET', 'users/1.json', []],
+                             separators=(',', ':'))
+            json.dump([{'key': key, 'status': 200, 'body': {'id': 1},
+                        'elapsed': 5}], f)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def make_api(self):
+        cassette = Cassette(self.path, CassetteMode.replay, latency='recorded')
+        return API('http://useresponse.test', 'token', cassette=cassette)
+
+    def test_latency_exceeding_deadline(self):
+        with self.assertRaises(DeadlineExceeded):
+            self.make_api().users.get(1, deadline=Deadline(0.05))
+
+    def test_latency_is_interrupted_by_cancel(self):
+        deadline = Deadline(10)
+        threading.Timer(0.05, deadline.cancel).start()
+        started = time.monotonic()
+        with self.assertRaises(OperationCancelled):
+            self.make_api().users.get(1, deadline=deadline)
+        self.assertLess(time.monotonic() - started, 1)
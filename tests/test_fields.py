@@ -0,0 +1,91 @@
+import unittest
+
+from useresponse.api import API, HTTPBackend
+from useresponse.api.fields import project
+
+
+RECORDS = [
+    {'id': 1, 'title': 'First', 'content': 'Long body'},
+    {'id': 2, 'title': 'Second', 'content': 'Long body'},
+]
+
+
+class FakeResponse(object):
+    def __init__(self, body):
+        self.status_code = 200
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class PagedBackend(HTTPBackend):
+    """Serves two pages of records for tickets and users search"""
+
+    def request(self, method, url, params=None, data=None, json=None,
+                timeout=None):
+        page = {
+            'totalPages': 2,
+            'data': [dict(record) for record in RECORDS],
+        }
+        if url.endswith('/tickets.json'):
+            return FakeResponse({'success': page})
+        return FakeResponse(page)
+
+    def transfer_size(self, response):
+        return 100, 400
+
+
+class ProjectTestCase(unittest.TestCase):
+    def test_tuple_of_fields(self):
+        self.assertEqual(
+            project(RECORDS, ('id', 'title')),
+            [{'id': 1, 'title': 'First'}, {'id': 2, 'title': 'Second'}],
+        )
+
+    def test_single_field_name(self):
+        self.assertEqual(project(RECORDS, 'id'), [{'id': 1}, {'id': 2}])
+
+    def test_missing_field_is_skipped(self):
+        self.assertEqual(
+            project(RECORDS, ['id', 'missing']), [{'id': 1}, {'id': 2}])
+
+    def test_none_keeps_records(self):
+        self.assertIs(project(RECORDS, None), RECORDS)
+
+
+class SearchFieldsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.api = API('http://useresponse.test', 'token',
+                       backend=PagedBackend())
+
+    def test_tickets_search(self):
+        result = self.api.tickets.search(fields=('id',))
+        self.assertEqual(result['success']['data'], [{'id': 1}, {'id': 2}])
+
+    def test_tickets_search_iter(self):
+        tickets = list(self.api.tickets.search_iter(fields='title'))
+        self.assertEqual(
+            [ticket['title'] for ticket in tickets],
+            ['First', 'Second'] * 2,
+        )
+        self.assertTrue(all(list(ticket) == ['title'] for ticket in tickets))
+
+    def test_users_search(self):
+        result = self.api.users.search(fields=('id', 'title'))
+        self.assertEqual(result['data'], [
+            {'id': 1, 'title': 'First'},
+            {'id': 2, 'title': 'Second'},
+        ])
+
+    def test_users_search_iter(self):
+        users = list(self.api.users.search_iter(fields=['id']))
+        self.assertEqual(users, [{'id': 1}, {'id': 2}] * 2)
+
+    def test_transfer_stats(self):
+        list(self.api.users.search_iter())
+        stats = self.api.transfer_stats
+        self.assertEqual(stats.requests, 2)
+        self.assertEqual(stats.wire_bytes, 200)
+        self.assertEqual(stats.decoded_bytes, 800)
+        self.assertEqual(stats.compression_ratio, 4.0)
@@ -0,0 +1,312 @@
+import asyncio
+import hashlib
+import hmac
+import io
+import json
+import time
+import unittest
+
+from useresponse.api.objects import ObjectService
+from useresponse.webhooks import (
+    ASGIWebhookApp,
+    EventQueue,
+    WebhookDispatcher,
+    WebhookEvent,
+    WSGIWebhookApp,
+    hmac_verifier,
+    parse_event,
+)
+
+
+def make_event(name, object_id):
+    return WebhookEvent(name, object_id, {})
+
+
+class ParseEventTestCase(unittest.TestCase):
+    def test_json_payload(self):
+        event = parse_event(
+            b'{"event": "ticket_updated", "object": {"id": 5}}',
+            'application/json',
+        )
+        self.assertEqual(event.name, 'ticket_updated')
+        self.assertEqual(event.object_id, 5)
+
+    def test_form_payload(self):
+        event = parse_event(b'event=comment_created&object_id=7')
+        self.assertEqual(event.name, 'comment_created')
+        self.assertEqual(event.object_id, 7)
+
+    def test_id_is_object_id_only_for_object_events(self):
+        event = parse_event(b'event=ticket_updated&id=5')
+        self.assertEqual(event.object_id, 5)
+        self.assertIsNone(parse_event(b'event=user_updated&id=5').object_id)
+        self.assertIsNone(parse_event(b'event=comment_created&id=5').object_id)
+
+    def test_object_id_must_be_integer(self):
+        self.assertEqual(
+            parse_event(b'{"event": "ticket_updated", "id": "12"}').object_id,
+            12,
+        )
+        for object_id in ('true', '1.9', '"1.9"', '"-1"', '[1]'):
+            body = f'{{"event": "ticket_updated", "id": {object_id}}}'
+            with self.assertRaises(ValueError):
+                parse_event(body.encode('utf-8'))
+
+    def test_payload_without_event_name_is_rejected(self):
+        for body in (b'', b'{}', b'id=5'):
+            with self.assertRaises(ValueError):
+                parse_event(body)
+
+
+class EventQueueTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_same_event_for_same_object_is_coalesced(self):
+        queue = EventQueue()
+        first = make_event('ticket_updated', 5)
+        second = make_event('ticket_updated', 5)
+        self.run_async(queue.put(first))
+        self.run_async(queue.put(second))
+        batch = self.run_async(queue.get_batch(10, 0))
+        self.assertEqual(batch, [second])
+
+    def test_different_events_are_not_coalesced(self):
+        queue = EventQueue()
+        events = [
+            make_event('ticket_updated', 5),
+            make_event('ticket_created', 5),
+            make_event('user_updated', None),
+            make_event('user_updated', None),
+        ]
+        for event in events:
+            self.run_async(queue.put(event))
+        batch = self.run_async(queue.get_batch(10, 0))
+        self.assertEqual(batch, events)
+
+    def test_put_waits_while_queue_is_full(self):
+        queue = EventQueue(maxsize=1)
+        self.run_async(queue.put(make_event('ticket_updated', 1)))
+        put = self.loop.create_task(queue.put(make_event('ticket_updated', 2)))
+        self.run_async(asyncio.sleep(0.01))
+        self.assertFalse(put.done())
+
+        batch = self.run_async(queue.get_batch(10, 0))
+        self.run_async(put)
+        self.assertEqual([event.object_id for event in batch], [1])
+        self.assertEqual(len(queue), 1)
+
+    def test_get_batch_waits_for_batch_to_fill(self):
+        queue = EventQueue()
+
+        async def put_later():
+            await asyncio.sleep(0.02)
+            await queue.put(make_event('ticket_updated', 2))
+
+        self.run_async(queue.put(make_event('ticket_updated', 1)))
+        self.loop.create_task(put_later())
+        started = time.monotonic()
+        batch = self.run_async(queue.get_batch(10, 0.1))
+        elapsed = time.monotonic() - started
+
+        self.assertEqual([event.object_id for event in batch], [1, 2])
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertEqual(len(queue), 0)
+        # queue stays usable after the timed out wait
+        self.run_async(queue.put(make_event('ticket_updated', 3)))
+        batch = self.run_async(queue.get_batch(10, 0.01))
+        self.assertEqual([event.object_id for event in batch], [3])
+
+    def test_get_batch_returns_when_full(self):
+        queue = EventQueue()
+        for object_id in range(3):
+            self.run_async(queue.put(make_event('ticket_updated', object_id)))
+        started = time.monotonic()
+        batch = self.run_async(queue.get_batch(3, 10))
+        self.assertEqual(len(batch), 3)
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_get_batch_respects_max_size(self):
+        queue = EventQueue()
+        for object_id in range(5):
+            self.run_async(queue.put(make_event('ticket_updated', object_id)))
+        batch = self.run_async(queue.get_batch(3, 0))
+        self.assertEqual([event.object_id for event in batch], [0, 1, 2])
+        self.assertEqual(len(queue), 2)
+
+
+class FakeObjects(object):
+    def __init__(self):
+        self.invalidated = []
+
+    def invalidate(self, id_):
+        self.invalidated.append(id_)
+
+
+class WebhookDispatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def test_invalidates_only_objects(self):
+        queue = EventQueue()
+        objects = FakeObjects()
+        batches = []
+
+        async def handle(events):
+            batches.append(events)
+
+        dispatcher = WebhookDispatcher(
+            queue, handle, batch_interval=0, objects=objects)
+        for body in (b'event=ticket_updated&id=5', b'event=user_updated&id=7'):
+            self.loop.run_until_complete(queue.put(parse_event(body)))
+        self.loop.run_until_complete(dispatcher.dispatch_batch())
+
+        self.assertEqual(objects.invalidated, [5])
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 2)
+
+
+class WebhookAppTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def call_asgi(self, app, body, headers=(), chunks=1):
+        sent = []
+        messages = [{'body': body, 'more_body': True}] * (chunks - 1)
+        messages.append({'body': body})
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {'type': 'http', 'method': 'POST', 'headers': list(headers)}
+        self.loop.run_until_complete(app(scope, receive, send))
+        return sent[0]['status']
+
+    def test_asgi_accepts_event(self):
+        queue = EventQueue()
+        app = ASGIWebhookApp(queue)
+        status = self.call_asgi(app, b'event=ticket_updated&id=1')
+        self.assertEqual(status, 202)
+        self.assertEqual(len(queue), 1)
+
+    def test_asgi_rejects_empty_body(self):
+        queue = EventQueue()
+        app = ASGIWebhookApp(queue)
+        self.assertEqual(self.call_asgi(app, b''), 400)
+        self.assertEqual(len(queue), 0)
+
+    def test_asgi_verifies_signature(self):
+        body = b'event=ticket_updated&id=1'
+        signature = hmac.new(b's3kre7', body, hashlib.sha256).hexdigest()
+        app = ASGIWebhookApp(EventQueue(), verify=hmac_verifier('s3kre7'))
+        for header, status in (
+            (signature.encode('ascii'), 202),
+            (b'0' * 64, 401),
+            (b'\xe9', 401),
+        ):
+            headers = [(b'x-useresponse-signature', header)]
+            self.assertEqual(self.call_asgi(app, body, headers), status)
+
+    def test_asgi_rejects_large_body(self):
+        queue = EventQueue()
+        app = ASGIWebhookApp(queue, max_body_size=100)
+        status = self.call_asgi(app, b'event=ticket_updated&id=1', chunks=5)
+        self.assertEqual(status, 413)
+        self.assertEqual(len(queue), 0)
+
+    def call_wsgi(self, app, body, chunked=False):
+        statuses = []
+        environ = {
+            'REQUEST_METHOD': 'POST',
+            'wsgi.input': io.BytesIO(body),
+        }
+        if chunked:
+            environ['wsgi.input_terminated'] = True
+        else:
+            environ['CONTENT_LENGTH'] = str(len(body))
+        app(environ, lambda status, headers: statuses.append(status))
+        return statuses[0]
+
+    def test_wsgi_verifies_signature(self):
+        body = b'event=ticket_updated&id=1'
+        app = WSGIWebhookApp(
+            EventQueue(), self.loop, verify=hmac_verifier('s3kre7'))
+        environ = {
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_LENGTH': str(len(body)),
+            'HTTP_X_USERESPONSE_SIGNATURE': '\xe9',
+            'wsgi.input': io.BytesIO(body),
+        }
+        statuses = []
+        app(environ, lambda status, headers: statuses.append(status))
+        self.assertEqual(statuses, ['401 Unauthorized'])
+
+    def test_wsgi_rejects_large_body(self):
+        app = WSGIWebhookApp(EventQueue(), self.loop, max_body_size=10)
+        body = b'event=ticket_updated&id=1'
+        self.assertEqual(self.call_wsgi(app, body), '413 Payload Too Large')
+        self.assertEqual(
+            self.call_wsgi(app, body, chunked=True), '413 Payload Too Large')
+
+    def test_wsgi_rejects_empty_chunked_body(self):
+        statuses = []
+        app = WSGIWebhookApp(EventQueue(), self.loop)
+        environ = {
+            'REQUEST_METHOD': 'POST',
+            'wsgi.input': io.BytesIO(b''),
+            'wsgi.input_terminated': True,
+        }
+        app(environ, lambda status, headers: statuses.append(status))
+        self.assertEqual(statuses, ['400 Bad Request'])
+
+
+class FakeTransport(object):
+    def __init__(self):
+        self.calls = 0
+        self.on_get = None
+
+    def get(self, path, params, deadline=None):
+        self.calls += 1
+        if self.on_get is not None:
+            self.on_get()
+        return {'success': {'id': 1, 'title': json.dumps(self.calls)}}
+
+
+class ObjectCacheTestCase(unittest.TestCase):
+    def test_cached_result_is_copied(self):
+        transport = FakeTransport()
+        objects = ObjectService(transport, cache={})
+        objects.get(1)['success']['title'] = 'changed'
+        objects.get(1)['success']['title'] = 'changed'
+        self.assertEqual(objects.get(1)['success']['title'], '1')
+        self.assertEqual(transport.calls, 1)
+
+    def test_result_fetched_during_invalidation_is_not_cached(self):
+        transport = FakeTransport()
+        objects = ObjectService(transport, cache={})
+        transport.on_get = lambda: objects.invalidate(1)
+        objects.get(1)
+        transport.on_get = None
+        objects.get(1)
+        self.assertEqual(transport.calls, 2)
@@ -1 +1,10 @@
-from .base import API
+from .base import (
+    API,
+    HTTPBackend,
+    RequestsBackend,
+    Urllib3Backend,
+    HttpxBackend,
+    TransferStats,
+)
+from .cassette import Cassette, CassetteMode
+from .deadline import Deadline, PartialResult
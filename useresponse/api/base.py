@@ -1,13 +1,19 @@
 import http.client as httplib
-from typing import Any, Dict, Optional
-from urllib.parse import urljoin
+import json as jsonlib
+import time
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+from urllib.parse import urlencode, urljoin
 
 import requests
+import urllib3
+from urllib3.util import make_headers
 
 from .users import UserService
 from .tickets import TicketService
 from .comments import CommentService
 from .objects import ObjectService
+from .cassette import Cassette, CassetteMode
+from .deadline import Deadline
 from .exceptions import (
     InvalidRequestException,
     UnauthenticatedException,
@@ -15,6 +21,9 @@ from .exceptions import (
     OperationConflictException,
     InternalServerError,
     ServiceUnavailableError,
+    DeadlineExceeded,
+    APIConnectionError,
+    APITimeoutError,
 )
 
 
@@ -27,15 +36,256 @@ ERROR_STATUSES = {
     httplib.SERVICE_UNAVAILABLE: ServiceUnavailableError,
 }
 
+# gzip and deflate, plus br and zstd when their decoders are installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+
+class HTTPBackend(object):
+    """Interface of HTTP clients used by the API transport
+
+    Backend performs a single HTTP request and returns response-like object,
+    which has ``status_code`` attribute and ``json()`` method. Backends should
+    negotiate compressed transfer with the server.
+
+    :cvar timeout_errors: (tuple) exceptions raised by the backend when
+    request times out
+    :cvar connection_errors: (tuple) exceptions raised by the backend when
+    request cannot be delivered or response cannot be received
+    """
+
+    timeout_errors: Tuple[type, ...] = ()
+    connection_errors: Tuple[type, ...] = ()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Tuple[float, float]] = None,
+    ) -> Any:
+        """Performs HTTP request
+
+        :param method: (str) HTTP method
+        :param url: (str) absolute url of the request
+        :param params: (dict) query string parameters
+        :param data: (dict) form-encoded request body
+        :param json: (dict) JSON request body
+        :param timeout: (tuple) connect timeout and total time budget of the
+        request, in seconds. Backends which have no total timeout use the
+        budget as read timeout. If not given, request may wait indefinitely
+        """
+        raise NotImplementedError
+
+    def transfer_size(self, response: Any) -> Tuple[int, int]:
+        """Returns sizes of the response body
+
+        :param response: response returned by :meth:`request`
+        :return: tuple of bytes received over the wire (compressed) and bytes
+        of decoded body
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Releases connections held by the backend"""
+        pass
+
+
+class RequestsBackend(HTTPBackend):
+    """Backend based on :class:`requests.Session`
+
+    This is the default backend. Unlike module-level ``requests`` functions,
+    session keeps connections alive between API calls.
+
+    :param session: (requests.Session) session to use. It is not modified,
+    headers required by the backend are passed with every request
+    """
+
+    timeout_errors = (requests.Timeout,)
+    connection_errors = (requests.ConnectionError,)
+
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        self._session = session if session is not None else requests.Session()
+        self._headers = {'Accept-Encoding': ACCEPT_ENCODING}
+
+    def request(
+        self, method, url, params=None, data=None, json=None, timeout=None,
+    ):
+        return self._session.request(
+            method, url, params=params, data=data, json=json,
+            headers=self._headers, timeout=timeout)
+
+    def transfer_size(self, response):
+        decoded = len(response.content)
+        tell = getattr(response.raw, 'tell', None)
+        return (tell() if tell is not None else decoded), decoded
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class _Urllib3Response(object):
+    def __init__(self, response: Any) -> None:
+        self.status_code = response.status
+        self.content = response.data
+        self.wire_bytes = response.tell()
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content.decode('utf-8'))
+
+
+class Urllib3Backend(HTTPBackend):
+    """Backend based on raw :class:`urllib3.PoolManager`
+
+    Skips hooks, adapters and cookie handling of ``requests``, which makes
+    it cheaper for a lot of small requests.
+
+    :param pool_kwargs: keyword arguments for :class:`urllib3.PoolManager`
+    """
+
+    timeout_errors = (urllib3.exceptions.TimeoutError,)
+    connection_errors = (
+        urllib3.exceptions.MaxRetryError,
+        urllib3.exceptions.ProtocolError,
+    )
+
+    def __init__(self, **pool_kwargs: Any) -> None:
+        self._headers = dict(pool_kwargs.pop('headers', None) or {})
+        self._headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self._pool = urllib3.PoolManager(**pool_kwargs)
+
+    def request(
+        self, method, url, params=None, data=None, json=None, timeout=None,
+    ):
+        headers = dict(self._headers)
+        body = None
+        if params:
+            url = f'{url}?{urlencode(params, doseq=True)}'
+        if data is not None:
+            body = urlencode(data, doseq=True)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        elif json is not None:
+            body = jsonlib.dumps(json)
+            headers['Content-Type'] = 'application/json'
+        kwargs = {}
+        if timeout is not None:
+            connect, total = timeout
+            kwargs['timeout'] = urllib3.Timeout(total=total, connect=connect)
+            # retrying timed out request would overrun the deadline
+            kwargs['retries'] = urllib3.Retry(3, connect=0, read=0)
+        try:
+            response = self._pool.urlopen(
+                method, url, body=body, headers=headers, **kwargs)
+        except urllib3.exceptions.MaxRetryError as e:
+            # NewConnectionError subclasses ConnectTimeoutError
+            reason = e.reason
+            if (isinstance(reason, self.timeout_errors) and
+                    not isinstance(reason,
+                                   urllib3.exceptions.NewConnectionError)):
+                raise reason
+            raise
+        return _Urllib3Response(response)
+
+    def transfer_size(self, response):
+        return response.wire_bytes, len(response.content)
+
+    def close(self) -> None:
+        self._pool.clear()
+
+
+class HttpxBackend(HTTPBackend):
+    """Backend based on :class:`httpx.Client`
+
+    Requires ``httpx`` to be installed (``pip install useresponse[httpx]``).
+
+    :param http2: (bool) whether to use HTTP/2, which multiplexes requests
+    over a single connection
+    :param client_kwargs: other keyword arguments for :class:`httpx.Client`.
+    Unlike httpx default, requests do not time out unless ``timeout`` is
+    given, same as with other backends
+    """
+
+    def __init__(self, http2: bool = True, **client_kwargs: Any) -> None:
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                'HttpxBackend requires httpx, install useresponse[httpx]')
+        client_kwargs.setdefault('timeout', None)
+        self._client = httpx.Client(http2=http2, **client_kwargs)
+        self.timeout_errors = (httpx.TimeoutException,)
+        # checked after timeout_errors, which are transport errors too
+        self.connection_errors = (httpx.TransportError,)
+        self._timeout_cls = httpx.Timeout
+
+    def request(
+        self, method, url, params=None, data=None, json=None, timeout=None,
+    ):
+        kwargs = {}
+        if timeout is not None:
+            connect, read = timeout
+            kwargs['timeout'] = self._timeout_cls(read, connect=connect)
+        return self._client.request(
+            method, url, params=params, data=data, json=json, **kwargs)
+
+    def transfer_size(self, response):
+        return response.num_bytes_downloaded, len(response.content)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class TransferStats(object):
+    """Accumulated sizes of responses received by the API
+
+    :ivar requests: (int) number of responses received over the network
+    :ivar wire_bytes: (int) bytes received over the wire, compressed
+    :ivar decoded_bytes: (int) bytes of decoded response bodies
+    """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of decoded to received bytes"""
+        if not self.wire_bytes:
+            return 1.0
+        return self.decoded_bytes / self.wire_bytes
+
+    def add(self, wire_bytes: int, decoded_bytes: int) -> None:
+        self.requests += 1
+        self.wire_bytes += wire_bytes
+        self.decoded_bytes += decoded_bytes
+
+    def __repr__(self) -> str:
+        return (
+            f'TransferStats(requests={self.requests}, '
+            f'wire_bytes={self.wire_bytes}, '
+            f'decoded_bytes={self.decoded_bytes})'
+        )
+
 
 class API(object):
-    def __init__(self, useresponse_domain: str, api_token: str) -> None:
-        self._transport = _Transport(useresponse_domain, api_token)
+    def __init__(
+        self,
+        useresponse_domain: str,
+        api_token: str,
+        cassette: Optional[Cassette] = None,
+        backend: Optional[HTTPBackend] = None,
+        object_cache: Optional[MutableMapping] = None,
+    ) -> None:
+        self._transport = _Transport(
+            useresponse_domain, api_token, cassette, backend)
 
         # register services
         self.users: UserService = UserService(self._transport)
         self.tickets: TicketService = TicketService(self._transport)
-        self.objects: ObjectService = ObjectService(self._transport)
+        self.objects: ObjectService = ObjectService(
+            self._transport, object_cache)
         self.comments: CommentService = CommentService(self._transport)
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -44,43 +294,109 @@ class API(object):
             raise ValueError(f'Cannot modify attribute {name}')
         super(API, self).__setattr__(name, value)
 
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """Sizes of responses received so far, compressed and decoded"""
+        return self._transport.stats
+
 
 class _Transport(object):
-    def __init__(self, domain: str, api_token: str) -> None:
+    def __init__(
+        self,
+        domain: str,
+        api_token: str,
+        cassette: Optional[Cassette] = None,
+        backend: Optional[HTTPBackend] = None,
+    ) -> None:
         self._domain = domain
         self._api_base = urljoin(self._domain, '/api/4.0/')
         self._api_token = api_token
+        self._cassette = cassette
+        self._backend = backend if backend is not None else RequestsBackend()
+        self.stats = TransferStats()
 
-    def get(self, path: str, params: Dict[str, Any]) -> Optional[Dict]:
+    def get(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         params = dict(params, **{'apiKey': self._api_token})
-        response = requests.get(self._get_url(path), params=params)
-        return self._process_response(response)
+        return self._request('GET', path, params, deadline, params=params)
 
-    def post(self, path: str, body: Dict[str, Any]) -> Optional[Dict]:
+    def post(
+        self,
+        path: str,
+        body: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         body = dict(body, **{'apiKey': self._api_token})
-        response = requests.post(self._get_url(path), data=body)
-        return self._process_response(response)
+        return self._request('POST', path, body, deadline, data=body)
 
-    def post_json(self, path: str, body: Dict[str, Any]) -> Optional[Dict]:
+    def post_json(
+        self,
+        path: str,
+        body: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         body = dict(body, **{'apiKey': self._api_token})
-        response = requests.post(self._get_url(path), json=body)
-        return self._process_response(response)
+        return self._request('POST', path, body, deadline, json=body)
 
-    def put(self, path: str, body: Dict[str, Any]) -> Optional[Dict]:
+    def put(
+        self,
+        path: str,
+        body: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         body = dict(body, **{'apiKey': self._api_token})
-        response = requests.put(self._get_url(path), data=body)
-        return self._process_response(response)
+        return self._request('PUT', path, body, deadline, data=body)
 
-    def delete(self, path: str) -> Optional[Dict]:
+    def delete(
+        self,
+        path: str,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         params = {'apiKey': self._api_token}
-        response = requests.delete(self._get_url(path), params=params)
+        return self._request('DELETE', path, params, deadline, params=params)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Dict[str, Any],
+        deadline: Optional[Deadline] = None,
+        **kwargs: Any,
+    ) -> Optional[Dict]:
+        if deadline is not None:
+            kwargs['timeout'] = deadline.timeouts()
+
+        cassette = self._cassette
+        if cassette is not None and cassette.mode == CassetteMode.replay:
+            response = cassette.replay(method, path, payload, deadline)
+            return self._process_response(response)
+
+        started = time.perf_counter()
+        url = self._get_url(path)
+        try:
+            response = self._backend.request(method, url, **kwargs)
+        except self._backend.timeout_errors as e:
+            if deadline is not None and deadline.expired:
+                raise DeadlineExceeded(f'Deadline exceeded: {e}') from e
+            # connect_timeout cap or timeout configured on the backend
+            raise APITimeoutError(f'Request to {url} timed out: {e}') from e
+        except self._backend.connection_errors as e:
+            raise APIConnectionError(f'Request to {url} failed: {e}') from e
+        self.stats.add(*self._backend.transfer_size(response))
+        if cassette is not None:
+            elapsed = time.perf_counter() - started
+            cassette.record(method, path, payload, response, elapsed)
         return self._process_response(response)
 
     def _get_url(self, path: str) -> str:
         path = path.lstrip('/')
         return urljoin(self._api_base, path)
 
-    def _process_response(self, response: requests.Response) -> Optional[Dict]:
+    def _process_response(self, response: Any) -> Optional[Dict]:
         if response.status_code in ERROR_STATUSES:
             raise ERROR_STATUSES[response.status_code](response)
         if response.status_code == httplib.NO_CONTENT:
@@ -0,0 +1,200 @@
+import http.client as httplib
+import json
+import time
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import CassetteMissError
+
+
+__all__ = (
+    'Cassette',
+    'CassetteMode',
+)
+
+
+SCRUBBED_PARAMS = ('apiKey', 'password')
+
+
+class CassetteMode(Enum):
+    record = 'record'
+    replay = 'replay'
+
+
+class _RecordedResponse(object):
+    """Response-like object replayed from a cassette"""
+
+    def __init__(self, status_code: int, body: Any) -> None:
+        self.status_code = status_code
+        self._body = body
+
+    def json(self) -> Any:
+        return self._body
+
+
+class Cassette(object):
+    """Records and replays HTTP interactions of the API transport
+
+    In ``record`` mode every request made through the API is performed as
+    usual and stored together with its response and the elapsed time.
+    In ``replay`` mode no network requests are made at all: responses are
+    looked up in the cassette, so runs are deterministic and can be used to
+    profile integration code offline.
+
+    The ``apiKey`` and ``password`` parameters are never written to the
+    cassette.
+
+    Usage:
+        >>> with Cassette('tickets.json', CassetteMode.record) as cassette:
+        ...     api = API('https://useresponse.domain', 'token',
+        ...               cassette=cassette)
+        ...     tickets = list(api.tickets.search_iter())
+        >>> cassette = Cassette('tickets.json', latency='recorded')
+        >>> api = API('https://useresponse.domain', 'token',
+        ...           cassette=cassette)
+
+    :param path: (str) path of the cassette file
+    :param mode: (CassetteMode) whether to record or replay interactions
+    :param latency: latency to simulate on replay. ``None`` replays without
+    delay, ``'recorded'`` sleeps for the time the recorded request took, a
+    number sleeps for that many seconds on every request
+    :param time_scale: (float) multiplier applied to the simulated latency
+    :param scrubbed_params: (iterable) names of request parameters which are
+    not written to the cassette
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: CassetteMode = CassetteMode.replay,
+        latency: Optional[Any] = None,
+        time_scale: float = 1.0,
+        scrubbed_params: Iterable[str] = SCRUBBED_PARAMS,
+    ) -> None:
+        if latency is not None and latency != 'recorded':
+            latency = float(latency)
+            if latency < 0:
+                raise ValueError(
+                    f'Latency must not be negative, got {latency}')
+        if time_scale < 0:
+            raise ValueError(
+                f'Time scale must not be negative, got {time_scale}')
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.time_scale = time_scale
+        self.scrubbed_params = frozenset(scrubbed_params)
+        self._interactions: List[Dict[str, Any]] = []
+        self._index: Dict[str, List[Dict[str, Any]]] = {}
+        self._replay_positions: Dict[str, int] = {}
+        if self.mode == CassetteMode.replay:
+            self.load()
+
+    def __enter__(self) -> 'Cassette':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.mode == CassetteMode.record:
+            self.save()
+
+    def load(self) -> None:
+        """Reads interactions from the cassette file"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self._interactions = json.load(f)
+        self._index = {}
+        for interaction in self._interactions:
+            self._index.setdefault(interaction['key'], []).append(interaction)
+        self._replay_positions = {}
+
+    def save(self) -> None:
+        """Writes recorded interactions to the cassette file"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self._interactions, f, separators=(',', ':'))
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        payload: Dict[str, Any],
+        response: Any,
+        elapsed: float,
+    ) -> None:
+        """Stores a performed request and its response
+
+        :param method: (str) HTTP method of the request
+        :param path: (str) API path of the request
+        :param payload: (dict) request params or body
+        :param response: response returned by the HTTP client
+        :param elapsed: (float) time the request took, in seconds
+        """
+        body = None
+        if response.status_code != httplib.NO_CONTENT:
+            try:
+                body = response.json()
+            except ValueError:
+                pass
+        interaction = {
+            'key': self._key(method, path, payload),
+            'status': response.status_code,
+            'body': body,
+            'elapsed': round(elapsed, 6),
+        }
+        self._interactions.append(interaction)
+        self._index.setdefault(interaction['key'], []).append(interaction)
+
+    def replay(
+        self,
+        method: str,
+        path: str,
+        payload: Dict[str, Any],
+        deadline: Optional[Any] = None,
+    ) -> _RecordedResponse:
+        """Returns recorded response for the request
+
+        Identical requests are answered in the order they were recorded.
+        Once all recordings of a request are used, the last one is repeated.
+
+        :param method: (str) HTTP method of the request
+        :param path: (str) API path of the request
+        :param payload: (dict) request params or body
+        :param deadline: (Deadline) deadline of the request. If simulated
+        latency does not fit into it, the deadline is exceeded. Cancelling
+        the deadline interrupts simulated latency
+        """
+        key = self._key(method, path, payload)
+        matches = self._index.get(key)
+        if not matches:
+            raise CassetteMissError(
+                f'No recorded interaction for {method} {path}')
+        position = self._replay_positions.get(key, 0)
+        interaction = matches[min(position, len(matches) - 1)]
+        self._replay_positions[key] = position + 1
+
+        delay = self._delay(interaction)
+        if deadline is not None:
+            deadline.sleep(min(delay, deadline.remaining()))
+        elif delay:
+            time.sleep(delay)
+        return _RecordedResponse(interaction['status'], interaction['body'])
+
+    def _delay(self, interaction: Dict[str, Any]) -> float:
+        if self.latency is None:
+            return 0.0
+        if self.latency == 'recorded':
+            return interaction['elapsed'] * self.time_scale
+        return self.latency * self.time_scale
+
+    def _key(self, method: str, path: str, payload: Dict[str, Any]) -> str:
+        items: List[Tuple[str, Any]] = sorted(
+            (
+                (k, v) for k, v in payload.items()
+                if k not in self.scrubbed_params
+            ),
+            key=lambda item: item[0],
+        )
+        return json.dumps(
+            [method.upper(), path.lstrip('/'), items],
+            separators=(',', ':'),
+            default=str,
+        )
+
@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import Dict, Optional, Any, Iterable
 
+from .deadline import Deadline
+
 
 class CommentSort(Enum):
     asc = 'asc'
@@ -16,6 +18,7 @@ class CommentService(object):
         is_private: bool = False,
         sort: Optional[CommentSort] = None,
         page: int = None,
+        deadline: Optional[Deadline] = None,
     ) -> Optional[Dict]:
         """Retrieves comments filtered by given parameters
         :param object_id: (int) object id to find comments on
@@ -24,6 +27,7 @@ class CommentService(object):
         :param page: (int) page to retrieve. With this option set useresponse
         will return selected page with limited number of comments. Only
         useresepsone knows how big is this number
+        :param deadline: (Deadline) time budget and cancellation of the call
         """
         request_params = {'is_private': int(is_private)}
         if page is not None:
@@ -33,7 +37,8 @@ class CommentService(object):
 
         return self._transport.get(
             f'/objects/{object_id}/comments.json',
-            request_params
+            request_params,
+            deadline,
         )
 
     def __init__(self, transport):
@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Optional, Tuple
+
+from .exceptions import DeadlineExceeded, OperationCancelled
+
+
+__all__ = (
+    'Deadline',
+    'PartialResult',
+)
+
+
+class Deadline(object):
+    """Time budget and cancellation token for API calls
+
+    Deadline can be passed to any service method. Remaining budget is used as
+    timeout of each HTTP request, and no request is started once the deadline
+    is exceeded or cancelled. Deadline can be cancelled from another thread.
+
+    How strictly the budget is enforced within a single request depends on
+    the HTTP backend. :class:`~useresponse.api.base.Urllib3Backend` limits the
+    total time of the request. ``requests`` and ``httpx`` only support
+    separate connect and read timeouts, and read timeout applies to every
+    socket read, so a slow connect followed by a slow response may take
+    several times the remaining budget. The deadline is still checked before
+    every following request.
+
+    Usage:
+        >>> deadline = Deadline(2.0)
+        >>> try:
+        ...     for ticket in api.tickets.search_iter(deadline=deadline):
+        ...         process(ticket)
+        ... except DeadlineExceeded as e:
+        ...     print(f'Stopped after {e.partial.pages_fetched} pages')
+
+    :param timeout: (float) time budget, in seconds
+    :param connect_timeout: (float) maximum time to wait for connection to be
+    established, in seconds. Defaults to the remaining budget
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        connect_timeout: Optional[float] = None,
+    ) -> None:
+        if timeout <= 0:
+            raise ValueError(f'Timeout must be positive, got {timeout}')
+        self.expires_at = time.monotonic() + timeout
+        self.connect_timeout = connect_timeout
+        self._cancelled = threading.Event()
+
+    def remaining(self) -> float:
+        """Returns remaining budget in seconds, zero if exceeded"""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Cancels operations using this deadline"""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Raises if the deadline is cancelled or exceeded
+
+        :raise OperationCancelled: if the deadline is cancelled
+        :raise DeadlineExceeded: if the time budget is spent
+        """
+        if self.cancelled:
+            raise OperationCancelled('Operation cancelled')
+        if self.expired:
+            raise DeadlineExceeded('Deadline exceeded')
+
+    def sleep(self, seconds: float) -> None:
+        """Sleeps, waking up early if the deadline is cancelled
+
+        :param seconds: (float) time to sleep, in seconds
+        :raise OperationCancelled: if the deadline is cancelled or exceeded
+        """
+        self._cancelled.wait(seconds)
+        self.check()
+
+    def timeouts(self) -> Tuple[float, float]:
+        """Returns connect timeout and total budget for the next request
+
+        :raise OperationCancelled: if the deadline is cancelled or exceeded
+        """
+        self.check()
+        remaining = self.remaining()
+        connect = remaining
+        if self.connect_timeout is not None:
+            connect = min(connect, self.connect_timeout)
+        return connect, remaining
+
+
+class PartialResult(object):
+    """Progress of iteration interrupted by cancellation or deadline
+
+    :ivar pages_fetched: (int) number of pages retrieved
+    :ivar items_yielded: (int) number of results yielded to the caller
+    :ivar total_pages: (int) total number of pages, if known
+    """
+
+    def __init__(self) -> None:
+        self.pages_fetched = 0
+        self.items_yielded = 0
+        self.total_pages: Optional[int] = None
+
+    @property
+    def next_page(self) -> int:
+        """Number of page to continue iteration from"""
+        return self.pages_fetched + 1
+
+    def __repr__(self) -> str:
+        return (
+            f'PartialResult(pages_fetched={self.pages_fetched}, '
+            f'items_yielded={self.items_yielded}, '
+            f'total_pages={self.total_pages})'
+        )
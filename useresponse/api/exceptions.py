@@ -47,3 +47,43 @@ class InternalServerError(ServerError):
 class ServiceUnavailableError(ServerError):
     """503"""
     pass
+
+
+class APIConnectionError(APIException):
+    """Request could not be delivered or response could not be received
+
+    Raised regardless of HTTP backend in use, original backend exception is
+    available as ``__cause__``.
+    """
+    pass
+
+
+class APITimeoutError(APIConnectionError):
+    """Request timed out before its deadline, e.g. because of connect timeout
+
+    Timeouts which exhaust the deadline are reported as
+    :class:`DeadlineExceeded` instead.
+    """
+    pass
+
+
+class CassetteMissError(APIException):
+    """Request has no recorded interaction in the replayed cassette"""
+    pass
+
+
+class OperationCancelled(APIException):
+    """Operation was cancelled before it completed
+
+    :ivar partial: (PartialResult) progress of the interrupted iteration, if
+    the operation was iterating through pages of results
+    """
+
+    def __init__(self, message, partial=None):
+        self.partial = partial
+        super(OperationCancelled, self).__init__(message)
+
+
+class DeadlineExceeded(OperationCancelled):
+    """Operation did not complete within its deadline"""
+    pass
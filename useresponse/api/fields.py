@@ -0,0 +1,26 @@
+from typing import Dict, Iterable, List, Optional, Union
+
+
+def project(
+    records: List[Dict],
+    fields: Optional[Union[str, Iterable[str]]],
+) -> List[Dict]:
+    """Trims every record to the given fields
+
+    Useresponse API has no parameter to select returned fields, so records
+    are trimmed after the whole response is decoded. This reduces memory held
+    by results, but not transfer or parsing cost.
+
+    :param records: (list) records to trim
+    :param fields: (iterable) names of fields to keep, or a name of single
+    field. If None, records are returned as is
+    """
+    if fields is None:
+        return records
+    if isinstance(fields, str):
+        fields = (fields,)
+    fields = tuple(fields)
+    return [
+        {name: record[name] for name in fields if name in record}
+        for record in records
+    ]
@@ -1,7 +1,12 @@
+import copy
+import threading
 from enum import Enum
 from typing import Dict
+from typing import MutableMapping
 from typing import Optional
 
+from .deadline import Deadline
+
 
 class ObjectOwnership(Enum):
     feedback = 'feedback'
@@ -29,18 +34,53 @@ class ObjectType(Enum):
 
 
 class ObjectService(object):
-    """Service which contains objects-related API calls"""
+    """Service which contains objects-related API calls
+
+    :param cache: (MutableMapping) optional mapping to cache results of
+    :meth:`get` in. Cached objects are kept until they are invalidated, e.g.
+    by :class:`useresponse.webhooks.WebhookDispatcher`. Result fetched while
+    any invalidation happens is not cached, as it may be already stale
+    """
 
-    def __init__(self, transport):
+    def __init__(self, transport, cache: Optional[MutableMapping] = None):
         self._transport = transport
+        self._cache = cache
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
 
-    def get(self, id_: int) -> Optional[Dict]:
+    def get(
+        self,
+        id_: int,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         """Retrieves object by id
 
         :param id_: (int) id of the object to retrieve
+        :param deadline: (Deadline) time budget and cancellation of the call
         :return: Dict which represents existing object, if any, otherwise None
         """
-        return self._transport.get(f'/objects/{id_}.json', {})
+        if self._cache is None:
+            return self._transport.get(f'/objects/{id_}.json', {}, deadline)
+
+        with self._cache_lock:
+            if id_ in self._cache:
+                return copy.deepcopy(self._cache[id_])
+            generation = self._cache_generation
+        result = self._transport.get(f'/objects/{id_}.json', {}, deadline)
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._cache[id_] = copy.deepcopy(result)
+        return result
+
+    def invalidate(self, id_: int) -> None:
+        """Drops cached result of :meth:`get` for object
+
+        :param id_: (int) id of the changed object
+        """
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache_generation += 1
+                self._cache.pop(id_, None)
 
     def create(
         self,
@@ -48,6 +88,7 @@ class ObjectService(object):
         object_type: ObjectType,
         title: str,
         content: str,
+        deadline: Optional[Deadline] = None,
         **extended_parameters: dict,
     ) -> Optional[Dict]:
         """Create new object
@@ -59,6 +100,7 @@ class ObjectService(object):
         :param content: (str) The content of a new object.
         Supports BBcode, but HTML tags are not allowed.
         Max content length: 12000 chars
+        :param deadline: (Deadline) time budget and cancellation of the call
         :param extended_parameters: (dict) Other parameters (JSON serializable)
         :return: Dict which represents existing object, if any, otherwise None
         """
@@ -70,5 +112,6 @@ class ObjectService(object):
                 'content': content,
             }
         }
-        result = self._transport.post_json('/objects.json', request_params)
+        result = self._transport.post_json(
+            '/objects.json', request_params, deadline)
         return result['success'] if result['success'] else None
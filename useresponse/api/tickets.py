@@ -1,6 +1,10 @@
 from enum import Enum
 from typing import Dict, Optional, Any, Iterable
 
+from .deadline import Deadline, PartialResult
+from .exceptions import OperationCancelled
+from .fields import project
+
 
 class TicketStatus(Enum):
     all = 'all'
@@ -43,6 +47,8 @@ class TicketService(object):
         sort: Optional[TicketSort] = None,
         page: int = 1,
         count: int = 20,
+        fields: Optional[Iterable[str]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Optional[Dict]:
         """Retrieves tickets filtered by given parameters
         :param text: (str) ticket text to filter on
@@ -54,6 +60,9 @@ class TicketService(object):
         :param page: (int) number of page of results to retrieve. Parameter is
         not present in useresponse api (hacked)
         :param count: (int) number of results per page
+        :param fields: (iterable) names of ticket fields to keep in results,
+        e.g. ``('id', 'title')``. All fields are kept if not given
+        :param deadline: (Deadline) time budget and cancellation of the call
         """
         if page < 1:
             raise ValueError(f'Page number must be a positive int, got {page}')
@@ -77,7 +86,11 @@ class TicketService(object):
         if sort is not None:
             request_params['sort'] = sort.value
 
-        return self._transport.get('/tickets.json', request_params)
+        result = self._transport.get('/tickets.json', request_params, deadline)
+        if fields is not None:
+            success = result['success']
+            success['data'] = project(success['data'], fields)
+        return result
 
     def search_iter(
         self,
@@ -87,6 +100,8 @@ class TicketService(object):
         author_id: Optional[int] = None,
         custom_fields: Optional[Dict[str, Any]] = None,
         sort: Optional[TicketSort] = None,
+        fields: Optional[Iterable[str]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Iterable[Dict]:
         """Retrieves tickets filtered by given parameters
 
@@ -104,21 +119,36 @@ class TicketService(object):
         :param page: (int) number of page of results to retrieve. Parameter is
         not present in useresponse api (hacked)
         :param count: (int) number of results per page
+        :param fields: (iterable) names of ticket fields to keep in results,
+        e.g. ``('id', 'title')``. All fields are kept if not given
+        :param deadline: (Deadline) time budget and cancellation of the
+        iteration. When it is exceeded or cancelled, raised exception has
+        ``partial`` attribute with the progress of the iteration
         """
         page: int = 1
+        progress = PartialResult()
         while True:
-            results = self.search(
-                text,
-                status,
-                date,
-                author_id,
-                custom_fields,
-                sort,
-                page=page,
-            )
+            try:
+                results = self.search(
+                    text,
+                    status,
+                    date,
+                    author_id,
+                    custom_fields,
+                    sort,
+                    page=page,
+                    fields=fields,
+                    deadline=deadline,
+                )
+            except OperationCancelled as e:
+                e.partial = progress
+                raise
             total_pages = results['success']['totalPages']
+            progress.pages_fetched = page
+            progress.total_pages = total_pages
             page += 1
             for value in results['success']['data']:
+                progress.items_yielded += 1
                 yield value
             if page > total_pages:
                 break
@@ -1,6 +1,10 @@
 from enum import Enum
 from typing import Dict, Iterable, Optional
 
+from .deadline import Deadline, PartialResult
+from .exceptions import OperationCancelled
+from .fields import project
+
 
 class SortCriteria(Enum):
     """Criterias to sort users in search by"""
@@ -17,22 +21,33 @@ class UserService(object):
     def __init__(self, transport):
         self._transport = transport
 
-    def get(self, id_: int) -> Optional[Dict]:
+    def get(
+        self,
+        id_: int,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         """Retrieves user by id
 
         :param id_: (int) id of the user to retrieve
+        :param deadline: (Deadline) time budget and cancellation of the call
         :return: Dict which represents existing user, if any, otherwise None
         """
-        return self._transport.get(f'/users/{id_}.json', {})
+        return self._transport.get(f'/users/{id_}.json', {}, deadline)
 
-    def get_by_email(self, email: str) -> Dict:
+    def get_by_email(
+        self,
+        email: str,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict:
         """Retrieves user by email
 
         :param email: (str) email of the user to retrieve
+        :param deadline: (Deadline) time budget and cancellation of the call
         :return: Dict which represents existing user, if any, otherwise None
         """
         request_params = {'email': email}
-        result = self._transport.get('/users/search.json', request_params)
+        result = self._transport.get(
+            '/users/search.json', request_params, deadline)
         return result['success'] if result['success'] else None
 
     def search(
@@ -42,6 +57,8 @@ class UserService(object):
         search: Optional[str] = None,
         page: int = 1,
         count: int = 20,
+        fields: Optional[Iterable[str]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Dict:
         """ Searches for users by given criterias
 
@@ -50,6 +67,9 @@ class UserService(object):
         :param search: (str) query string to search users by
         :param page: (int) number of page of results to retrieve
         :param count: (int) number of results per page
+        :param fields: (iterable) names of user fields to keep in results,
+        e.g. ``('id', 'email')``. All fields are kept if not given
+        :param deadline: (Deadline) time budget and cancellation of the call
         """
         if page < 1:
             raise ValueError(f'Page number must be a positive int, got {page}')
@@ -65,13 +85,19 @@ class UserService(object):
             request_params['role'] = role
         if search is not None:
             request_params['search'] = search
-        return self._transport.get('/users/search.json', request_params)
+        result = self._transport.get(
+            '/users/search.json', request_params, deadline)
+        if fields is not None:
+            result['data'] = project(result['data'], fields)
+        return result
 
     def search_iter(
         self,
         sort: Optional[SortCriteria] = None,
         role: Optional[str] = None,
         search: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Iterable[Dict]:
         """Searches for users by given criterias
 
@@ -87,14 +113,29 @@ class UserService(object):
         :param sort: (SortCriteria) criteria for sorting results
         :param role: (str) role of the users
         :param search: (str) query string to search users by
+        :param fields: (iterable) names of user fields to keep in results,
+        e.g. ``('id', 'email')``. All fields are kept if not given
+        :param deadline: (Deadline) time budget and cancellation of the
+        iteration. When it is exceeded or cancelled, raised exception has
+        ``partial`` attribute with the progress of the iteration
         """
         page: int = 1
         total_pages: int = 0
+        progress = PartialResult()
         while True:
-            results = self.search(sort, role, search, page=page)
+            try:
+                results = self.search(
+                    sort, role, search, page=page, fields=fields,
+                    deadline=deadline)
+            except OperationCancelled as e:
+                e.partial = progress
+                raise
             total_pages = results['totalPages']
+            progress.pages_fetched = page
+            progress.total_pages = total_pages
             page += 1
             for value in results['data']:
+                progress.items_yielded += 1
                 yield value
             if page > total_pages:
                 break
@@ -104,6 +145,7 @@ class UserService(object):
         id_: int,
         email: Optional[str] = None,
         full_name: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Optional[Dict]:
         """Edits user with given id
 
@@ -114,6 +156,7 @@ class UserService(object):
         :param id_: (int) user id
         :param email: (str) new email
         :param full_name: (str) new full_name
+        :param deadline: (Deadline) time budget and cancellation of the call
         """
         request_params = {}
         if email is not None:
@@ -122,18 +165,25 @@ class UserService(object):
             request_params['full_name'] = full_name
         if not request_params:
             raise ValueError('Either email or full_name must be provided')
-        result = self._transport.post(f'/users/{id_}.json', request_params)
+        result = self._transport.post(
+            f'/users/{id_}.json', request_params, deadline)
         return result['success'] if result['success'] else None
 
-    def change_password(self, id_: int, new_password: str) -> Optional[Dict]:
+    def change_password(
+        self,
+        id_: int,
+        new_password: str,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         """Changes password for user
 
         :param id_: (int) user id
         :param new_password: (str) new password to set
+        :param deadline: (Deadline) time budget and cancellation of the call
         """
         request_params = {'password': new_password}
         result = self._transport.post(f'/users/{id_}/change-password.json',
-                                      request_params)
+                                      request_params, deadline)
         return result['success'] if result['success'] else None
 
     def create(
@@ -141,22 +191,29 @@ class UserService(object):
         email: str,
         full_name: str,
         password: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Optional[Dict]:
         """Creates a new user
 
         :param email: (str) new email
         :param full_name: (str) new full_name
+        :param deadline: (Deadline) time budget and cancellation of the call
         """
         request_params = {'email': email, 'full_name': full_name}
         if password is not None:
             request_params['password'] = password
-        result = self._transport.post('/users.json', request_params)
+        result = self._transport.post('/users.json', request_params, deadline)
         return result['success'] if result['success'] else None
 
-    def delete(self, id_: int) -> Optional[Dict]:
+    def delete(
+        self,
+        id_: int,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[Dict]:
         """Deletes user by id
 
         :param id_: (int) user id
+        :param deadline: (Deadline) time budget and cancellation of the call
         """
-        result = self._transport.delete(f'/users/{id_}.json')
+        result = self._transport.delete(f'/users/{id_}.json', deadline)
         return result['success'] if result['success'] else None
@@ -0,0 +1,422 @@
+import asyncio
+import concurrent.futures
+import hashlib
+import hmac
+import itertools
+import json
+import logging
+import re
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qsl
+
+from .api.objects import ObjectType
+
+
+__all__ = (
+    'WebhookEvent',
+    'EventQueue',
+    'WebhookDispatcher',
+    'WSGIWebhookApp',
+    'ASGIWebhookApp',
+    'hmac_verifier',
+    'parse_event',
+)
+
+
+logger = logging.getLogger(__name__)
+
+Verifier = Callable[[Mapping[str, str], bytes], bool]
+# event name prefixes of events about objects, e.g. ``ticket_updated``
+OBJECT_EVENT_PREFIXES = frozenset(
+    ['object'] + [object_type.value for object_type in ObjectType])
+BatchHandler = Callable[[List['WebhookEvent']], Awaitable[None]]
+
+MAX_BODY_SIZE = 256 * 1024
+
+
+class WebhookEvent(object):
+    """Event received from useresponse webhook
+
+    :param name: (str) name of the event, e.g. ``ticket_updated``
+    :param object_id: (int) id of the object (ticket, idea, article, etc.)
+    the event is about. None for events about other entities, e.g. users
+    :param payload: (dict) parsed webhook payload
+    """
+
+    def __init__(
+        self,
+        name: Optional[str],
+        object_id: Optional[int],
+        payload: Dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.object_id = object_id
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return f'WebhookEvent(name={self.name!r}, object_id={self.object_id})'
+
+
+def parse_event(body: bytes, content_type: str = '') -> WebhookEvent:
+    """Parses webhook request body into event
+
+    Both JSON and form-encoded payloads are supported. Object id is taken
+    from ``object_id`` or ``object.id`` fields, or from ``id`` field if event
+    name says it is about an object.
+
+    :param body: (bytes) request body
+    :param content_type: (str) value of the Content-Type header
+    :raise ValueError: if payload cannot be parsed or has no event name
+    """
+    text = body.decode('utf-8')
+    if 'json' in content_type or text.lstrip().startswith('{'):
+        payload = json.loads(text)
+        if not isinstance(payload, dict):
+            raise ValueError('Webhook payload must be an object')
+    else:
+        payload = dict(parse_qsl(text, strict_parsing=True))
+
+    name = payload.get('event') or payload.get('type')
+    if not name or not isinstance(name, str):
+        raise ValueError('Webhook payload has no event name')
+    object_id = payload.get('object_id')
+    obj = payload.get('object')
+    if object_id is None and isinstance(obj, dict):
+        object_id = obj.get('id')
+    if object_id is None and _is_object_event(name):
+        object_id = payload.get('id')
+    if object_id is not None:
+        object_id = _parse_id(object_id)
+    return WebhookEvent(name, object_id, payload)
+
+
+def _parse_id(value: Any) -> int:
+    # bool is an int subclass, and int() would truncate floats
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and re.fullmatch(r'\d+', value, re.ASCII):
+        return int(value)
+    raise ValueError(f'Invalid object id: {value!r}')
+
+
+def _is_object_event(name: str) -> bool:
+    prefix = name.replace('.', '_').split('_', 1)[0]
+    return prefix.lower() in OBJECT_EVENT_PREFIXES
+
+
+def hmac_verifier(
+    secret: str,
+    header: str = 'X-Useresponse-Signature',
+) -> Verifier:
+    """Creates verifier which checks HMAC-SHA256 signature of request body
+
+    :param secret: (str) secret shared with the webhook sender
+    :param header: (str) name of the header which contains hex signature
+    """
+    key = secret.encode('utf-8')
+    header = header.lower()
+
+    def verify(headers: Mapping[str, str], body: bytes) -> bool:
+        # header values are latin-1 strings, compare_digest accepts only
+        # ASCII in str arguments
+        signature = headers.get(header, '').encode('latin-1')
+        expected = hmac.new(key, body, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected.encode('ascii'), signature)
+
+    return verify
+
+
+class EventQueue(object):
+    """Bounded queue of webhook events
+
+    Events with the same name for the same object are coalesced: while an
+    event waits in the queue, newer one replaces it without taking an extra
+    slot. Events without object id are never coalesced. When the queue is
+    full, :meth:`put` waits until dispatcher frees some space.
+
+    Queue must be created in the thread which runs its event loop.
+
+    :param maxsize: (int) maximum number of events waiting in the queue
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        if maxsize < 1:
+            raise ValueError(f'Max size must be a positive int, got {maxsize}')
+        self.maxsize = maxsize
+        self._pending: 'OrderedDict[Any, WebhookEvent]' = OrderedDict()
+        self._changed = asyncio.Condition()
+        self._anonymous_keys = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def put(self, event: WebhookEvent) -> None:
+        """Puts event into the queue, waiting for free slot if needed"""
+        if event.object_id is None:
+            key: Any = ('anonymous', next(self._anonymous_keys))
+        else:
+            key = (event.name, event.object_id)
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: key in self._pending or not self.full())
+            self._pending[key] = event
+            self._changed.notify_all()
+
+    async def get_batch(
+        self,
+        max_size: int,
+        max_wait: float,
+    ) -> List[WebhookEvent]:
+        """Takes events from the queue
+
+        Waits for the first event, then waits up to ``max_wait`` seconds for
+        the batch to fill up to ``max_size`` events.
+
+        :param max_size: (int) maximum number of events in batch
+        :param max_wait: (float) time to wait for batch to fill, in seconds
+        """
+        loop = asyncio.get_event_loop()
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._pending)
+            # asyncio.wait_for around Condition.wait may leave the lock
+            # released on timeout in python 3.6, so wake up by notification
+            timed_out = False
+
+            def time_out():
+                nonlocal timed_out
+                timed_out = True
+                loop.create_task(self._notify())
+
+            timer = loop.call_later(max_wait, time_out)
+            try:
+                await self._changed.wait_for(
+                    lambda: timed_out or len(self._pending) >= max_size)
+            finally:
+                timer.cancel()
+            batch = []
+            while self._pending and len(batch) < max_size:
+                batch.append(self._pending.popitem(last=False)[1])
+            self._changed.notify_all()
+        return batch
+
+    def full(self) -> bool:
+        return len(self._pending) >= self.maxsize
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+
+class WebhookDispatcher(object):
+    """Delivers queued webhook events to handler in batches
+
+    Usage:
+        >>> async def handle(events):
+        ...     for event in events:
+        ...         print(event.name, event.object_id)
+        >>> queue = EventQueue()
+        >>> dispatcher = WebhookDispatcher(queue, handle, objects=api.objects)
+        >>> asyncio.ensure_future(dispatcher.run())
+
+    :param queue: (EventQueue) queue to take events from
+    :param handler: coroutine function which receives list of events
+    :param batch_size: (int) maximum number of events passed to handler
+    :param batch_interval: (float) time to wait for batch to fill, in seconds
+    :param objects: (ObjectService) service which cached objects are
+    invalidated before events about them are handled. Events about other
+    entities, e.g. users, do not invalidate anything
+    """
+
+    def __init__(
+        self,
+        queue: EventQueue,
+        handler: BatchHandler,
+        batch_size: int = 50,
+        batch_interval: float = 0.5,
+        objects: Optional[Any] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(
+                f'Batch size must be a positive int, got {batch_size}')
+        self.queue = queue
+        self._handler = handler
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._objects = objects
+
+    async def run(self) -> None:
+        """Dispatches events until cancelled"""
+        while True:
+            await self.dispatch_batch()
+
+    async def dispatch_batch(self) -> None:
+        """Waits for single batch of events and passes it to handler"""
+        batch = await self.queue.get_batch(
+            self.batch_size, self.batch_interval)
+        if self._objects is not None:
+            for event in batch:
+                if event.object_id is not None:
+                    self._objects.invalidate(event.object_id)
+        try:
+            await self._handler(batch)
+        except Exception:
+            logger.exception('Failed to handle %d webhook events', len(batch))
+
+
+class _WebhookApp(object):
+    def __init__(
+        self,
+        queue: EventQueue,
+        verify: Optional[Verifier] = None,
+        max_body_size: int = MAX_BODY_SIZE,
+    ) -> None:
+        self.queue = queue
+        self._verify = verify
+        self.max_body_size = max_body_size
+
+    def _parse(
+        self,
+        method: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes],
+    ) -> Tuple[Optional[WebhookEvent], str]:
+        if method != 'POST':
+            return None, '405 Method Not Allowed'
+        if body is None:
+            return None, '413 Payload Too Large'
+        if self._verify is not None and not self._verify(headers, body):
+            return None, '401 Unauthorized'
+        try:
+            event = parse_event(body, headers.get('content-type', ''))
+        except ValueError:
+            return None, '400 Bad Request'
+        return event, '202 Accepted'
+
+
+class WSGIWebhookApp(_WebhookApp):
+    """WSGI application which receives useresponse webhooks
+
+    Received events are put into ``queue``, which is served by event loop
+    running in another thread. If the queue stays full for ``put_timeout``
+    seconds, request is rejected with 503 so the sender retries it later.
+
+    :param queue: (EventQueue) queue to put events into
+    :param loop: event loop the queue belongs to
+    :param verify: callable which receives lower-cased headers and body and
+    returns whether request is authentic, e.g. :func:`hmac_verifier`
+    :param put_timeout: (float) time to wait for free slot in queue, seconds
+    :param max_body_size: (int) maximum size of request body, in bytes.
+    Larger requests are rejected with 413
+    """
+
+    def __init__(
+        self,
+        queue: EventQueue,
+        loop: asyncio.AbstractEventLoop,
+        verify: Optional[Verifier] = None,
+        put_timeout: float = 5.0,
+        max_body_size: int = MAX_BODY_SIZE,
+    ) -> None:
+        super(WSGIWebhookApp, self).__init__(queue, verify, max_body_size)
+        self._loop = loop
+        self.put_timeout = put_timeout
+
+    def __call__(
+        self,
+        environ: Dict[str, Any],
+        start_response: Callable,
+    ) -> Iterable[bytes]:
+        headers = {
+            key[5:].replace('_', '-').lower(): value
+            for key, value in environ.items()
+            if key.startswith('HTTP_')
+        }
+        if environ.get('CONTENT_TYPE'):
+            headers['content-type'] = environ['CONTENT_TYPE']
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            length = 0
+        body: Optional[bytes] = b''
+        if length > self.max_body_size:
+            body = None
+        elif length:
+            body = environ['wsgi.input'].read(length)
+        elif environ.get('wsgi.input_terminated'):
+            # chunked request, server signals end of input
+            body = environ['wsgi.input'].read(self.max_body_size + 1)
+            if len(body) > self.max_body_size:
+                body = None
+
+        event, status = self._parse(environ['REQUEST_METHOD'], headers, body)
+        if event is not None:
+            future = asyncio.run_coroutine_threadsafe(
+                self.queue.put(event), self._loop)
+            try:
+                future.result(self.put_timeout)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                status = '503 Service Unavailable'
+        start_response(status, [('Content-Type', 'text/plain')])
+        return [status.encode('ascii')]
+
+
+class ASGIWebhookApp(_WebhookApp):
+    """ASGI application which receives useresponse webhooks
+
+    Received events are put into ``queue``. While the queue is full, the
+    request waits for free slot, slowing down the sender.
+
+    :param queue: (EventQueue) queue to put events into
+    :param verify: callable which receives lower-cased headers and body and
+    returns whether request is authentic, e.g. :func:`hmac_verifier`
+    :param max_body_size: (int) maximum size of request body, in bytes.
+    Larger requests are rejected with 413
+    """
+
+    async def __call__(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable,
+        send: Callable,
+    ) -> None:
+        if scope['type'] != 'http':
+            return
+        headers = {
+            key.decode('latin-1').lower(): value.decode('latin-1')
+            for key, value in scope.get('headers', [])
+        }
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body and size <= self.max_body_size:
+            message = await receive()
+            chunk = message.get('body', b'')
+            chunks.append(chunk)
+            size += len(chunk)
+            more_body = message.get('more_body', False)
+        body = b''.join(chunks) if size <= self.max_body_size else None
+
+        event, status = self._parse(scope['method'], headers, body)
+        if event is not None:
+            await self.queue.put(event)
+        await send({
+            'type': 'http.response.start',
+            'status': int(status.split(' ', 1)[0]),
+            'headers': [(b'content-type', b'text/plain')],
+        })
+        await send({
+            'type': 'http.response.body',
+            'body': status.encode('ascii'),
+        })